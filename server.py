@@ -9,22 +9,73 @@ to modify data.
 All create, update, and delete operations are disabled for safety.
 """
 
+import asyncio
+import functools
 import os
 import json
+import re
+import sys
+import tempfile
+import time
 import logging
+import pickle
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import httpx
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from mcp.server.fastmcp.server import FastMCP
 
-# Try to load environment variables from .env file
+if TYPE_CHECKING:
+    import httpx
+
+# Try to load environment variables from .env file (skip the import and
+# filesystem walk entirely when no .env is present). MCP clients launch
+# the server from arbitrary working directories, so check next to this
+# file as well as the CWD rather than relying on the CWD alone.
+_env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.path.exists(_env_path) or os.path.exists(".env"):
+    try:
+        from dotenv import load_dotenv
+        # Default search first (baseline behavior), then the sidecar file
+        # for keys not found; load_dotenv never overrides existing values
+        load_dotenv()
+        load_dotenv(_env_path)
+    except ImportError:
+        # dotenv is optional
+        pass
+
+# uvloop replaces the default selector event loop with libuv when installed
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import uvloop
+    uvloop.install()
 except ImportError:
-    # dotenv is optional
+    # uvloop is optional
     pass
 
+# orjson parses JSON in C from raw bytes, skipping the text decoder entirely
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to stdlib json
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to JSON with orjson when available, stdlib json otherwise."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, stdlib json otherwise."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Configure logging
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -33,8 +84,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def _lifespan(_server: FastMCP):
+    """Close the shared HTTP client on the loop that created it.
+
+    Running cleanup here, inside the server's own event loop, avoids the
+    cross-loop teardown problems of atexit hooks or a post-run
+    asyncio.run(): closing a client with pooled connections from a
+    different loop raises "Event loop is closed".
+    """
+    try:
+        yield {}
+    finally:
+        await cleanup()
+
+
 # Initialize MCP server
-mcp = FastMCP("LinearB API Server")
+mcp = FastMCP("LinearB API Server", lifespan=_lifespan)
 
 # Get configuration from environment variables
 API_KEY = os.getenv("LINEARB_API_KEY")
@@ -45,229 +111,548 @@ if not API_KEY:
 API_TIMEOUT = float(os.getenv("API_TIMEOUT", "30.0"))
 BASE_URL = os.getenv("LINEARB_BASE_URL", "https://public-api.linearb.io")
 
-# Initialize HTTP client with proper configuration
-client = httpx.AsyncClient(
-    base_url=BASE_URL,
-    headers={
-        "x-api-key": API_KEY,
-        "Content-Type": "application/json",
-        "User-Agent": "LinearB-MCP-Server/1.0"
-    },
-    timeout=API_TIMEOUT
-)
+# The HTTP client (and the httpx import itself) is created lazily on first
+# use so discovery-only consumers such as demo_discovery.py never pay the
+# httpx import cost.
+client = None
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """Return the shared AsyncClient, creating it on first use."""
+    global client
+    if client is None:
+        import httpx
+
+        # HTTP/2 multiplexes concurrent requests over one connection; requires h2
+        try:
+            import h2  # noqa: F401
+            http2_available = True
+        except ImportError:
+            http2_available = False
+
+        # Explicit pool limits so concurrent tool calls are not throttled by
+        # the default 10-connection pool
+        client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers={
+                "x-api-key": API_KEY,
+                "Content-Type": "application/json",
+                "User-Agent": "LinearB-MCP-Server/1.0"
+            },
+            # Fail fast on unreachable hosts while keeping the configured
+            # read budget for slow measurement queries
+            timeout=httpx.Timeout(API_TIMEOUT, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                http2=http2_available,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+    return client
+
+
+# Bounded fan-out helper: callers that run several tool calls at once (see
+# bulk_tool_call) go through this rather than a bare gather, so a large
+# batch cannot stampede the API with unbounded concurrent requests.
+_api_semaphore = asyncio.Semaphore(int(os.getenv("API_CONCURRENCY", "10")))
+
+
+async def _bounded(coro):
+    """Await one coroutine while holding the shared concurrency limit."""
+    async with _api_semaphore:
+        return await coro
+
+
+async def _gather_bounded(*coros) -> List[Any]:
+    """Run coroutines concurrently under the shared API concurrency bound,
+    returning results (or exceptions) in submission order."""
+    return await asyncio.gather(*(_bounded(c) for c in coros), return_exceptions=True)
 
 # Load OpenAPI specification for discovery service
 OPENAPI_SPEC = None
+_spec_mtime = None
+_spec_cache_path = None
+_cached_spec_indexes = None
 try:
     openapi_path = Path(__file__).parent / "openAPI.json"
+    if not openapi_path.exists():
+        # Fall back to lowercase name on case-sensitive filesystems
+        openapi_path = Path(__file__).parent / "openapi.json"
     if openapi_path.exists():
-        with open(openapi_path, 'r') as f:
-            OPENAPI_SPEC = json.load(f)
-        logger.info("OpenAPI specification loaded successfully")
+        _spec_mtime = openapi_path.stat().st_mtime
+        _spec_cache_path = openapi_path.with_suffix(".pkl")
+
+        # Try the pickle sidecar first: protocol-5 load is much faster than
+        # re-parsing the JSON and rebuilding the discovery indexes
+        if _spec_cache_path.exists():
+            try:
+                with open(_spec_cache_path, 'rb') as f:
+                    _cached = pickle.load(f)
+                if _cached[0] == _spec_mtime:
+                    OPENAPI_SPEC = _cached[1]
+                    _cached_spec_indexes = _cached[2:]
+                    logger.info("OpenAPI specification loaded from cache")
+            except Exception as e:
+                logger.warning("Failed to load OpenAPI cache, re-parsing: %s", e)
+
+        if OPENAPI_SPEC is None:
+            with open(openapi_path, 'rb') as f:
+                raw_spec = f.read()
+            OPENAPI_SPEC = _json_loads(raw_spec)
+            logger.info("OpenAPI specification loaded successfully")
     else:
         logger.warning("OpenAPI specification file not found")
 except Exception as e:
-    logger.error(f"Failed to load OpenAPI specification: {e}")
+    logger.error("Failed to load OpenAPI specification: %s", e)
 
 # Documentation paths
 DOCS_PATH = Path(__file__).parent / "docs"
 
+# =============================================================================
+# OPENAPI DISCOVERY INDEXES
+# =============================================================================
+# Built once at spec load time so the discovery tools are constant-time dict
+# lookups instead of re-walking the whole spec on every MCP call.
+
+_ENDPOINT_CATEGORIES = (
+    "deployments", "teams", "services", "incidents",
+    "measurements", "health", "custom_metrics"
+)
+
+# Tag substring -> category, checked in order; replaces the if/elif chain
+_TAG_CATEGORY_MAP = (
+    ("deployment", "deployments"),
+    ("team", "teams"),
+    ("service", "services"),
+    ("incident", "incidents"),
+    ("measurement", "measurements"),
+    ("metric", "measurements"),
+    ("health", "health"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _classify_tag(tag: str) -> Optional[str]:
+    """Map an OpenAPI tag to an endpoint category (memoized per unique tag)."""
+    tag_lower = tag.lower()
+    return next((cat for kw, cat in _TAG_CATEGORY_MAP if kw in tag_lower), None)
+
+
+# (METHOD, path) -> MCP tool name, built once; the spec index build calls
+# _get_mcp_tool_name for every operation, so the table must not be a literal
+# recreated inside the function
+_MCP_TOOL_NAME_MAP = {
+    # Read-only endpoints (GET operations)
+    ("GET", "/api/v1/deployments"): "list_deployments",
+    ("GET", "/api/v2/teams"): "search_teams_v2",
+    ("GET", "/api/v1/users"): "search_users",
+    ("GET", "/api/v1/services/"): "get_services",
+    ("GET", "/api/v1/services/{service_id}"): "get_service",
+    ("GET", "/api/v1/incidents/{provider_id}"): "get_incident",
+    ("GET", "/api/v1/health"): "health_check",
+
+    # Read-only POST operations (search/query operations)
+    ("POST", "/api/v1/incidents/search"): "search_incidents",
+    ("POST", "/api/v2/measurements"): "post_metrics",
+    ("POST", "/api/v2/measurements/export"): "export_metrics",
+
+    # Write operations are commented out for read-only server
+    # ("POST", "/api/v1/deployments"): "create_deployment",
+    # ("POST", "/api/v2/teams"): "create_teams_v2",
+    # ("DELETE", "/api/v2/teams/{team_id}"): "delete_team_v2",
+    # ("PATCH", "/api/v2/teams/{team_id}"): "update_team_v2",
+    # ("POST", "/api/v2/teams/{team_id}/members"): "add_team_members_v2",
+    # ("DELETE", "/api/v2/teams/{team_id}/members/{user_id_or_email}"): "remove_team_member_v2",
+    # ("POST", "/api/v1/users"): "create_users",
+    # ("DELETE", "/api/v1/users/{user_id}"): "delete_user",
+    # ("PATCH", "/api/v1/users/{user_id}"): "update_user",
+    # ("POST", "/api/v1/incidents"): "create_incident",
+    # ("POST", "/api/v1/incidents/{provider_id}"): "update_incident",
+    # ("DELETE", "/api/v1/incidents/{provider_id}"): "delete_incident",
+    # ("POST", "/api/v1/report/metric"): "post_custom_metric",
+    # ("POST", "/api/v1/cycle-time-stages"): "create_cycle_time_stage",
+}
+
+
+def _get_mcp_tool_name(endpoint_path: str, method: str) -> Optional[str]:
+    """Helper function to map API endpoints to MCP tool names."""
+    return _MCP_TOOL_NAME_MAP.get((method.upper(), endpoint_path))
+
+
+# Shared read-only sentinel for absent optional mappings; avoids allocating
+# a fresh empty dict on every .get(..., {}) miss
+_EMPTY: Dict[str, Any] = {}
+
+
+def _build_spec_indexes(spec: Dict[str, Any]) -> tuple:
+    """
+    Walk the OpenAPI spec once and build the discovery lookup tables.
+
+    Returns:
+        Tuple of (endpoint_index, endpoint_detail_index, category_index) where
+        endpoint_index maps "METHOD /path" keys to summary endpoint info,
+        endpoint_detail_index maps (path, METHOD) to detailed endpoint info,
+        and category_index maps category names to lists of endpoint keys.
+    """
+    endpoint_index: Dict[str, Dict[str, Any]] = {}
+    endpoint_detail_index: Dict[Any, Dict[str, Any]] = {}
+    category_index: Dict[str, List[str]] = {cat: [] for cat in _ENDPOINT_CATEGORIES}
+
+    for path, methods in spec.get("paths", {}).items():
+        # Paths and methods recur as keys across every index entry; interning
+        # collapses the duplicates to shared string objects
+        path = sys.intern(path)
+        for method, details in methods.items():
+            method_upper = sys.intern(method.upper())
+            endpoint_key = sys.intern(f"{method_upper} {path}")
+
+            endpoint_info = {
+                "path": path,
+                "method": method_upper,
+                "summary": details.get("summary", ""),
+                "description": details.get("description", ""),
+                "tags": details.get("tags", []),
+                "parameters": [],
+                "request_body": None,
+                "responses": details.get("responses", {}),
+                "operation_id": details.get("operationId", "")
+            }
+
+            detail_info = {
+                "endpoint": f"{method_upper} {path}",
+                "summary": details.get("summary", ""),
+                "description": details.get("description", ""),
+                "tags": details.get("tags", []),
+                "parameters": {
+                    "query": [],
+                    "path": [],
+                    "header": []
+                },
+                "request_body": None,
+                "responses": {},
+                "examples": {},
+                "mcp_tool_name": _get_mcp_tool_name(path, method)
+            }
+
+            # Extract parameters
+            for param in details.get("parameters", []):
+                # Fetch the shared fields once instead of chaining .get({})
+                # allocations for every attribute
+                schema = param.get("schema") or _EMPTY
+                param_name = param.get("name")
+                param_required = param.get("required", False)
+                param_description = param.get("description", "")
+
+                endpoint_info["parameters"].append({
+                    "name": param_name,
+                    "in": param.get("in"),
+                    "required": param_required,
+                    "type": schema.get("type"),
+                    "description": param_description
+                })
+
+                param_info = {
+                    "name": param_name,
+                    "type": schema.get("type", "string"),
+                    "required": param_required,
+                    "description": param_description,
+                    "default": schema.get("default"),
+                    "enum": schema.get("enum"),
+                    "minimum": schema.get("minimum"),
+                    "maximum": schema.get("maximum")
+                }
+                param_location = param.get("in", "query")
+                detail_info["parameters"].setdefault(param_location, []).append(param_info)
+
+            # Extract request body info
+            if "requestBody" in details:
+                request_body = details["requestBody"]
+                body_required = request_body.get("required", False)
+                body_content = request_body.get("content", {})
+                json_content = body_content.get("application/json", {})
+                body_schema = json_content.get("schema", {})
+                body_examples = json_content.get("examples", {})
+                endpoint_info["request_body"] = {
+                    "required": body_required,
+                    "content_types": list(body_content.keys()),
+                    "schema": body_schema,
+                    "examples": body_examples
+                }
+                detail_info["request_body"] = {
+                    "required": body_required,
+                    "content_type": "application/json",
+                    "schema": body_schema,
+                    "examples": body_examples
+                }
+
+            # Extract response info
+            for status_code, response in details.get("responses", {}).items():
+                detail_info["responses"][status_code] = {
+                    "description": response.get("description", ""),
+                    "schema": response.get("content", {}).get("application/json", {}).get("schema", {})
+                }
+
+            endpoint_index[endpoint_key] = endpoint_info
+            endpoint_detail_index[(path, method_upper)] = detail_info
+
+            # Categorize endpoints by tag
+            for tag in details.get("tags", []):
+                category = _classify_tag(tag)
+                if category:
+                    category_index[category].append(endpoint_key)
+
+    return endpoint_index, endpoint_detail_index, category_index
+
+
+if OPENAPI_SPEC and _cached_spec_indexes:
+    ENDPOINT_INDEX, ENDPOINT_DETAIL_INDEX, CATEGORY_INDEX = _cached_spec_indexes
+elif OPENAPI_SPEC:
+    ENDPOINT_INDEX, ENDPOINT_DETAIL_INDEX, CATEGORY_INDEX = _build_spec_indexes(OPENAPI_SPEC)
+    # Write the sidecar cache so later cold starts skip the parse + index build
+    try:
+        with open(_spec_cache_path, 'wb') as f:
+            pickle.dump(
+                (_spec_mtime, OPENAPI_SPEC, ENDPOINT_INDEX, ENDPOINT_DETAIL_INDEX, CATEGORY_INDEX),
+                f, protocol=5
+            )
+    except Exception as e:
+        logger.warning("Failed to write OpenAPI cache: %s", e)
+else:
+    ENDPOINT_INDEX, ENDPOINT_DETAIL_INDEX, CATEGORY_INDEX = {}, {}, {cat: [] for cat in _ENDPOINT_CATEGORIES}
+
+# Freeze the indexes so they are safely shared across concurrent async tasks
+ENDPOINT_INDEX = MappingProxyType(ENDPOINT_INDEX)
+ENDPOINT_DETAIL_INDEX = MappingProxyType(ENDPOINT_DETAIL_INDEX)
+CATEGORY_INDEX = MappingProxyType(CATEGORY_INDEX)
+
 # =============================================================================
 # SUPPORTED METRICS REFERENCE
 # =============================================================================
 
-SUPPORTED_METRICS = {
-    "branch.computed.cycle_time": {
-        "name": "branch.computed.cycle_time",
-        "aggregations": ["p75", "p50", "avg"],
-        "description": "Full cycle time (Coding time + Pickup time + Review time + Time to production)",
-        "units": "min",
-        "category": "cycle_time"
-    },
-    "branch.time_to_pr": {
-        "name": "branch.time_to_pr",
-        "aggregations": ["p75", "p50", "avg"],
-        "description": "Coding time (Time to PR)",
-        "units": "min",
-        "category": "cycle_time"
-    },
-    "branch.time_to_review": {
-        "name": "branch.time_to_review",
-        "aggregations": ["p75", "p50", "avg"],
-        "description": "Pickup time (Time to review)",
-        "units": "min",
-        "category": "cycle_time"
-    },
-    "branch.review_time": {
-        "name": "branch.review_time",
-        "aggregations": ["p75", "p50", "avg"],
-        "description": "Review time",
-        "units": "min",
-        "category": "cycle_time"
-    },
-    "branch.time_to_prod": {
-        "name": "branch.time_to_prod",
-        "aggregations": ["p75", "p50", "avg"],
-        "description": "Time to production (Time to deploy)",
-        "units": "min",
-        "category": "cycle_time"
-    },
-    "pr.merged.size": {
-        "name": "pr.merged.size",
-        "aggregations": ["p75", "p50", "avg"],
-        "description": "The sum of PR sizes of merged PRs",
-        "units": "lines of code",
-        "category": "pull_requests"
-    },
-    "pr.merged": {
-        "name": "pr.merged",
-        "aggregations": [],
-        "description": "The number of PRs that got merged",
-        "units": "count",
-        "category": "pull_requests"
-    },
-    "pr.review_depth": {
-        "name": "pr.review_depth",
-        "aggregations": [],
-        "description": "The sum of comments divided by the sum of PRs",
-        "units": "lines of comments",
-        "category": "pull_requests"
-    },
-    "commit.activity.new_work.count": {
-        "name": "commit.activity.new_work.count",
-        "aggregations": [],
-        "description": "The total new lines of code",
-        "units": "count",
-        "category": "commits"
-    },
-    "commit.total_changes": {
-        "name": "commit.total_changes",
-        "aggregations": [],
-        "description": "The total lines of code that have been replaced",
-        "units": "lines of code",
-        "category": "commits"
-    },
-    "commit.activity.refactor.count": {
-        "name": "commit.activity.refactor.count",
-        "aggregations": [],
-        "description": "The total lines of code that have been replaced that are older then 25 days",
-        "units": "lines of code",
-        "category": "commits"
-    },
-    "commit.activity.rework.count": {
-        "name": "commit.activity.rework.count",
-        "aggregations": [],
-        "description": "The total lines of code that have replaced code written within the last 25 days, but outside this branch",
-        "units": "lines of code",
-        "category": "commits"
-    },
-    "pr.merged.without.review.count": {
-        "name": "pr.merged.without.review.count",
-        "aggregations": [],
-        "description": "The number of PRs that got merged without review",
-        "units": "count",
-        "category": "pull_requests"
-    },
-    "commit.total.count": {
-        "name": "commit.total.count",
-        "aggregations": [],
-        "description": "The sum of commits",
-        "units": "count",
-        "category": "commits"
-    },
-    "pr.new": {
-        "name": "pr.new",
-        "aggregations": [],
-        "description": "The number of opened PRs",
-        "units": "count",
-        "category": "pull_requests"
-    },
-    "pr.reviews": {
-        "name": "pr.reviews",
-        "aggregations": [],
-        "description": "The number of reviews on all PRs",
-        "units": "count",
-        "category": "pull_requests"
-    },
-    "releases.count": {
-        "name": "releases.count",
-        "aggregations": [],
-        "description": "The number of releases",
-        "units": "count",
-        "category": "releases"
-    },
-    "commit.activity_days": {
-        "name": "commit.activity_days",
-        "aggregations": [],
-        "description": "The amount of day of developer activity (commit/comment/PR/merge/review)",
-        "units": "days",
-        "category": "activity"
-    },
-    "branch.state.computed.done": {
-        "name": "branch.state.computed.done",
-        "aggregations": [],
-        "description": "Number of branches that reached state done",
-        "units": "count",
-        "category": "branches"
-    },
-    "branch.state.active": {
-        "name": "branch.state.active",
-        "aggregations": [],
-        "description": "Number of active branches",
-        "units": "count",
-        "category": "branches"
-    },
-    "pm.mttr": {
-        "name": "pm.mttr",
-        "aggregations": [],
-        "description": "Mean time to repair",
-        "units": "min",
-        "category": "incidents"
-    },
-    "pm.cfr.issues.done": {
-        "name": "pm.cfr.issues.done",
-        "aggregations": [],
-        "description": "The sum of issues that are considered as incidents that reached a done state",
-        "units": "count",
-        "category": "incidents"
+# Compiled search-term validators: one C-level match trims and length-checks
+# in a single pass instead of paired .strip()/len() calls per request
+_SEARCH_TERM_RE = re.compile(r"\A\s*(\S(?:.{0,98}\S)?)\s*\Z", re.S)  # 1-100 chars, trimmed
+_FOCUS_TERM_RE = re.compile(r"\A\s*(\S.*?\S)\s*\Z", re.S)            # >= 2 chars, trimmed
+
+
+@dataclass(frozen=True, slots=True)
+class MetricDef:
+    """Definition of a supported LinearB metric (immutable, slotted).
+
+    The metric name lives only as the SUPPORTED_METRICS key and is injected
+    into responses at output time.
+    """
+    aggregations: tuple
+    description: str
+    units: str
+    category: str
+
+
+SUPPORTED_METRICS = MappingProxyType({
+    sys.intern("branch.computed.cycle_time"): MetricDef(
+        aggregations=("p75", "p50", "avg"),
+        description="Full cycle time (Coding time + Pickup time + Review time + Time to production)",
+        units="min",
+        category="cycle_time"
+    ),
+    sys.intern("branch.time_to_pr"): MetricDef(
+        aggregations=("p75", "p50", "avg"),
+        description="Coding time (Time to PR)",
+        units="min",
+        category="cycle_time"
+    ),
+    sys.intern("branch.time_to_review"): MetricDef(
+        aggregations=("p75", "p50", "avg"),
+        description="Pickup time (Time to review)",
+        units="min",
+        category="cycle_time"
+    ),
+    sys.intern("branch.review_time"): MetricDef(
+        aggregations=("p75", "p50", "avg"),
+        description="Review time",
+        units="min",
+        category="cycle_time"
+    ),
+    sys.intern("branch.time_to_prod"): MetricDef(
+        aggregations=("p75", "p50", "avg"),
+        description="Time to production (Time to deploy)",
+        units="min",
+        category="cycle_time"
+    ),
+    sys.intern("pr.merged.size"): MetricDef(
+        aggregations=("p75", "p50", "avg"),
+        description="The sum of PR sizes of merged PRs",
+        units="lines of code",
+        category="pull_requests"
+    ),
+    sys.intern("pr.merged"): MetricDef(
+        aggregations=(),
+        description="The number of PRs that got merged",
+        units="count",
+        category="pull_requests"
+    ),
+    sys.intern("pr.review_depth"): MetricDef(
+        aggregations=(),
+        description="The sum of comments divided by the sum of PRs",
+        units="lines of comments",
+        category="pull_requests"
+    ),
+    sys.intern("commit.activity.new_work.count"): MetricDef(
+        aggregations=(),
+        description="The total new lines of code",
+        units="count",
+        category="commits"
+    ),
+    sys.intern("commit.total_changes"): MetricDef(
+        aggregations=(),
+        description="The total lines of code that have been replaced",
+        units="lines of code",
+        category="commits"
+    ),
+    sys.intern("commit.activity.refactor.count"): MetricDef(
+        aggregations=(),
+        description="The total lines of code that have been replaced that are older then 25 days",
+        units="lines of code",
+        category="commits"
+    ),
+    sys.intern("commit.activity.rework.count"): MetricDef(
+        aggregations=(),
+        description="The total lines of code that have replaced code written within the last 25 days, but outside this branch",
+        units="lines of code",
+        category="commits"
+    ),
+    sys.intern("pr.merged.without.review.count"): MetricDef(
+        aggregations=(),
+        description="The number of PRs that got merged without review",
+        units="count",
+        category="pull_requests"
+    ),
+    sys.intern("commit.total.count"): MetricDef(
+        aggregations=(),
+        description="The sum of commits",
+        units="count",
+        category="commits"
+    ),
+    sys.intern("pr.new"): MetricDef(
+        aggregations=(),
+        description="The number of opened PRs",
+        units="count",
+        category="pull_requests"
+    ),
+    sys.intern("pr.reviews"): MetricDef(
+        aggregations=(),
+        description="The number of reviews on all PRs",
+        units="count",
+        category="pull_requests"
+    ),
+    sys.intern("releases.count"): MetricDef(
+        aggregations=(),
+        description="The number of releases",
+        units="count",
+        category="releases"
+    ),
+    sys.intern("commit.activity_days"): MetricDef(
+        aggregations=(),
+        description="The amount of day of developer activity (commit/comment/PR/merge/review)",
+        units="days",
+        category="activity"
+    ),
+    sys.intern("branch.state.computed.done"): MetricDef(
+        aggregations=(),
+        description="Number of branches that reached state done",
+        units="count",
+        category="branches"
+    ),
+    sys.intern("branch.state.active"): MetricDef(
+        aggregations=(),
+        description="Number of active branches",
+        units="count",
+        category="branches"
+    ),
+    sys.intern("pm.mttr"): MetricDef(
+        aggregations=(),
+        description="Mean time to repair",
+        units="min",
+        category="incidents"
+    ),
+    sys.intern("pm.cfr.issues.done"): MetricDef(
+        aggregations=(),
+        description="The sum of issues that are considered as incidents that reached a done state",
+        units="count",
+        category="incidents"
+    ),
+})
+
+# Plain-dict views of the metric definitions, built once for responses
+# (FastMCP serializes dicts; dataclasses stay internal)
+_METRIC_DICTS = MappingProxyType({
+    name: {
+        "name": name,
+        "aggregations": list(metric.aggregations),
+        "description": metric.description,
+        "units": metric.units,
+        "category": metric.category
     }
-}
+    for name, metric in SUPPORTED_METRICS.items()
+})
+
+METRIC_NAMES = tuple(SUPPORTED_METRICS)
+
+# Lowercased (name, description) pairs cached once so the search loop does
+# no per-call .lower() allocations
+_METRIC_SEARCH_TEXT = MappingProxyType({
+    name: (name.lower(), metric.description.lower())
+    for name, metric in SUPPORTED_METRICS.items()
+})
+
+METRICS_WITH_AGGREGATION = frozenset(
+    name for name, data in SUPPORTED_METRICS.items() if data.aggregations
+)
+
+# Group metrics by category in a single pass rather than one scan per category
+_metrics_by_category = defaultdict(list)
+for _metric_name, _metric_data in SUPPORTED_METRICS.items():
+    _metrics_by_category[_metric_data.category].append(_metric_name)
 
 METRICS_CATEGORIES = {
     "cycle_time": {
         "name": "Cycle Time Metrics",
         "description": "Metrics related to development cycle time and flow",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "cycle_time"]
+        "metrics": _metrics_by_category["cycle_time"]
     },
     "pull_requests": {
         "name": "Pull Request Metrics",
         "description": "Metrics related to pull requests and code reviews",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "pull_requests"]
+        "metrics": _metrics_by_category["pull_requests"]
     },
     "commits": {
         "name": "Commit Metrics",
         "description": "Metrics related to commits and code changes",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "commits"]
+        "metrics": _metrics_by_category["commits"]
     },
     "releases": {
         "name": "Release Metrics",
         "description": "Metrics related to software releases",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "releases"]
+        "metrics": _metrics_by_category["releases"]
     },
     "activity": {
         "name": "Activity Metrics",
         "description": "Metrics related to developer activity",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "activity"]
+        "metrics": _metrics_by_category["activity"]
     },
     "branches": {
         "name": "Branch Metrics",
         "description": "Metrics related to branch states",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "branches"]
+        "metrics": _metrics_by_category["branches"]
     },
     "incidents": {
         "name": "Incident Metrics",
         "description": "Metrics related to incidents and reliability",
-        "metrics": [m for m, data in SUPPORTED_METRICS.items() if data["category"] == "incidents"]
+        "metrics": _metrics_by_category["incidents"]
     }
 }
 
@@ -275,84 +660,202 @@ METRICS_CATEGORIES = {
 # ACTIVE TEAMS REFERENCE
 # =============================================================================
 
-ACTIVE_TEAMS = {
-    "analytics": {
-        "name": "Analytics",
-        "short_name": "Aly",
-        "type": "engineering",
-        "description": "Analytics and data engineering team",
-        "color": "#DC143C",  # Crimson red
-        "comparable": True,
-        "focus_areas": ["data analytics", "business intelligence", "data engineering"]
-    },
-    "cfd_titans": {
-        "name": "CFD (Titans)",
-        "short_name": "CFD",
-        "type": "engineering",
-        "description": "CFD Titans engineering team",
-        "color": "#32CD32",  # Lime green
-        "comparable": True,
-        "focus_areas": ["Client Focus Delivery", "Support"]
-    },
-    "core_crm": {
-        "name": "Core CRM",
-        "short_name": "CC",
-        "type": "engineering",
-        "description": "Core CRM platform team",
-        "color": "#4169E1",  # Royal blue
-        "comparable": True,
-        "focus_areas": ["customer relationship management", "core platform"]
-    },
-    "integrations_synergy": {
-        "name": "Integrations(Synergy)",
-        "short_name": "I",
-        "type": "engineering",
-        "description": "Integrations and Synergy team",
-        "color": "#FF8C00",  # Dark orange
-        "comparable": True,
-        "focus_areas": ["system integrations", "api development", "third-party connections"]
-    },
-    "media": {
-        "name": "Media",
-        "short_name": "Med",
-        "type": "engineering",
-        "description": "Media and content management team",
-        "color": "#00BFFF",  # Deep sky blue
-        "comparable": True,
-        "focus_areas": ["media processing", "content management", "digital assets"]
-    },
-    "shinsei": {
-        "name": "Shinsei",
-        "short_name": "S",
-        "type": "engineering",
-        "description": "Shinsei development team",
-        "color": "#DA70D6",  # Orchid purple
-        "comparable": True,
-        "focus_areas": ["new product development", "innovation"]
-    },
-    "qa_automation": {
-        "name": "QA-Automation",
-        "short_name": "QA",
-        "type": "qa",
-        "description": "Quality Assurance and Test Automation team",
-        "color": "#FFD700",  # Gold
-        "comparable": False,
-        "focus_areas": ["test automation", "quality assurance", "testing frameworks"]
+@dataclass(frozen=True, slots=True)
+class TeamDef:
+    """Definition of an active team (immutable, slotted).
+
+    The team id lives only as the ACTIVE_TEAMS key; responses are served
+    from the plain-dict views in _TEAM_DICTS.
+    """
+    name: str
+    short_name: str
+    type: str
+    description: str
+    color: str
+    comparable: bool
+    focus_areas: tuple
+
+
+ACTIVE_TEAMS = MappingProxyType({
+    sys.intern("analytics"): TeamDef(
+        name="Analytics",
+        short_name="Aly",
+        type="engineering",
+        description="Analytics and data engineering team",
+        color="#DC143C",  # Crimson red
+        comparable=True,
+        focus_areas=("data analytics", "business intelligence", "data engineering")
+    ),
+    sys.intern("cfd_titans"): TeamDef(
+        name="CFD (Titans)",
+        short_name="CFD",
+        type="engineering",
+        description="CFD Titans engineering team",
+        color="#32CD32",  # Lime green
+        comparable=True,
+        focus_areas=("Client Focus Delivery", "Support")
+    ),
+    sys.intern("core_crm"): TeamDef(
+        name="Core CRM",
+        short_name="CC",
+        type="engineering",
+        description="Core CRM platform team",
+        color="#4169E1",  # Royal blue
+        comparable=True,
+        focus_areas=("customer relationship management", "core platform")
+    ),
+    sys.intern("integrations_synergy"): TeamDef(
+        name="Integrations(Synergy)",
+        short_name="I",
+        type="engineering",
+        description="Integrations and Synergy team",
+        color="#FF8C00",  # Dark orange
+        comparable=True,
+        focus_areas=("system integrations", "api development", "third-party connections")
+    ),
+    sys.intern("media"): TeamDef(
+        name="Media",
+        short_name="Med",
+        type="engineering",
+        description="Media and content management team",
+        color="#00BFFF",  # Deep sky blue
+        comparable=True,
+        focus_areas=("media processing", "content management", "digital assets")
+    ),
+    sys.intern("shinsei"): TeamDef(
+        name="Shinsei",
+        short_name="S",
+        type="engineering",
+        description="Shinsei development team",
+        color="#DA70D6",  # Orchid purple
+        comparable=True,
+        focus_areas=("new product development", "innovation")
+    ),
+    sys.intern("qa_automation"): TeamDef(
+        name="QA-Automation",
+        short_name="QA",
+        type="qa",
+        description="Quality Assurance and Test Automation team",
+        color="#FFD700",  # Gold
+        comparable=False,
+        focus_areas=("test automation", "quality assurance", "testing frameworks")
+    )
+})
+
+# Plain-dict views mirroring _METRIC_DICTS: built once, handed out in
+# responses so the frozen dataclasses never hit the serializer
+_TEAM_DICTS = MappingProxyType({
+    team_id: {
+        "name": team.name,
+        "short_name": team.short_name,
+        "type": team.type,
+        "description": team.description,
+        "color": team.color,
+        "comparable": team.comparable,
+        "focus_areas": list(team.focus_areas)
     }
-}
+    for team_id, team in ACTIVE_TEAMS.items()
+})
+
+# Lowercased (name, description, focus areas) per team, mirroring
+# _METRIC_SEARCH_TEXT so the search loop avoids per-call .lower() calls
+_TEAM_SEARCH_TEXT = MappingProxyType({
+    team_id: (
+        team.name.lower(),
+        team.description.lower(),
+        tuple(area.lower() for area in team.focus_areas)
+    )
+    for team_id, team in ACTIVE_TEAMS.items()
+})
+
+# All searchable fields fused into one string per team, joined with a
+# control character no query can contain, so verification is a single
+# linear substring scan instead of one scan per field
+_TEAM_SEARCH_BLOB = MappingProxyType({
+    team_id: "\x01".join((name_lower, desc_lower, *focus_lower))
+    for team_id, (name_lower, desc_lower, focus_lower) in _TEAM_SEARCH_TEXT.items()
+})
+
+# Group teams by type in a single pass rather than one scan per type
+_teams_by_type = defaultdict(list)
+for _team_id, _team in ACTIVE_TEAMS.items():
+    _teams_by_type[_team.type].append(_team_id)
 
 TEAM_TYPES = {
     "engineering": {
         "name": "Engineering Teams",
         "description": "Software development and engineering teams",
         "comparable": True,
-        "teams": [team_id for team_id, team in ACTIVE_TEAMS.items() if team["type"] == "engineering"]
+        "teams": _teams_by_type["engineering"]
     },
     "qa": {
         "name": "Quality Assurance Teams",
         "description": "QA and testing teams - tracked separately from engineering squads",
         "comparable": False,
-        "teams": [team_id for team_id, team in ACTIVE_TEAMS.items() if team["type"] == "qa"]
+        "teams": _teams_by_type["qa"]
+    }
+}
+
+# Team reference data is static, so the comparable/excluded partitions and
+# the team-tool responses are built once here instead of per call
+_COMPARABLE_TEAMS = {
+    team_id: _TEAM_DICTS[team_id]
+    for team_id, team in ACTIVE_TEAMS.items()
+    if team.comparable
+}
+_EXCLUDED_TEAMS = {
+    team_id: _TEAM_DICTS[team_id]
+    for team_id, team in ACTIVE_TEAMS.items()
+    if not team.comparable
+}
+
+# Frozen id sets used for filter pushdown in team searches: the narrowest
+# partition is intersected before any string scanning happens
+_ALL_TEAM_IDS = frozenset(ACTIVE_TEAMS)
+_COMPARABLE_TEAM_IDS = frozenset(_COMPARABLE_TEAMS)
+_TEAM_IDS_BY_TYPE = {
+    type_key: frozenset(type_info["teams"])
+    for type_key, type_info in TEAM_TYPES.items()
+}
+
+_ACTIVE_TEAMS_RESPONSE = {
+    "total_teams": len(ACTIVE_TEAMS),
+    "team_types": len(TEAM_TYPES),
+    "teams": dict(_TEAM_DICTS),
+    "types": TEAM_TYPES,
+    "usage_note": "Use team names in metrics queries. Engineering teams are comparable, QA teams should be analyzed separately."
+}
+
+_COMPARABLE_TEAMS_RESPONSE = {
+    "total_comparable_teams": len(_COMPARABLE_TEAMS),
+    "teams": _COMPARABLE_TEAMS,
+    "excluded_teams": _EXCLUDED_TEAMS,
+    "usage_note": "These teams can be compared in metrics analysis. QA teams are tracked separately."
+}
+
+_TEAMS_BY_TYPE_RESPONSES = {
+    type_key: {
+        "team_type": type_key,
+        "name": type_info["name"],
+        "description": type_info["description"],
+        "comparable": type_info["comparable"],
+        "total_teams": len(type_info["teams"]),
+        "teams": {team_id: _TEAM_DICTS[team_id] for team_id in type_info["teams"]}
+    }
+    for type_key, type_info in TEAM_TYPES.items()
+}
+
+_TEAM_TYPES_OVERVIEW = {
+    "total_types": len(TEAM_TYPES),
+    "types": {
+        type_key: {
+            "name": type_info["name"],
+            "description": type_info["description"],
+            "comparable": type_info["comparable"],
+            "team_count": len(type_info["teams"]),
+            "teams": type_info["teams"]
+        }
+        for type_key, type_info in TEAM_TYPES.items()
     }
 }
 
@@ -361,6 +864,13 @@ TEAM_TYPES = {
 # DISCOVERY SERVICE TOOLS
 # =============================================================================
 
+# Discovery responses are pure functions of the static spec/reference data,
+# so they are memoized across calls. Set LRU_BYPASS=1 to disable (tests);
+# the flag also routes the lru_cache-backed _impl lookups around their
+# caches via __wrapped__.
+_CACHE_DISABLED = os.getenv("LRU_BYPASS", "").lower() in ("1", "true", "yes")
+_discovery_cache: Dict[str, Any] = {}
+
 @mcp.tool(name="discover_api", description="Get comprehensive API information and available endpoints")
 async def discover_api() -> Dict[str, Any]:
     """
@@ -381,77 +891,17 @@ async def discover_api() -> Dict[str, Any]:
             ]
         }
     
+    if not _CACHE_DISABLED and "discover_api" in _discovery_cache:
+        return _discovery_cache["discover_api"]
+
+    # Serve from the indexes precomputed at spec load time
     discovery_info = {
         "api_info": OPENAPI_SPEC.get("info", {}),
         "base_url": OPENAPI_SPEC.get("servers", [{}])[0].get("url", BASE_URL),
-        "endpoints": {},
-        "categories": {
-            "deployments": [],
-            "teams": [],
-            "services": [],
-            "incidents": [],
-            "measurements": [],
-            "health": [],
-            "custom_metrics": []
-        }
+        "endpoints": dict(ENDPOINT_INDEX),
+        "categories": {category: list(keys) for category, keys in CATEGORY_INDEX.items()}
     }
-    
-    # Process all endpoints from OpenAPI spec
-    for path, methods in OPENAPI_SPEC.get("paths", {}).items():
-        for method, details in methods.items():
-            endpoint_info = {
-                "path": path,
-                "method": method.upper(),
-                "summary": details.get("summary", ""),
-                "description": details.get("description", ""),
-                "tags": details.get("tags", []),
-                "parameters": [],
-                "request_body": None,
-                "responses": details.get("responses", {}),
-                "operation_id": details.get("operationId", "")
-            }
-            
-            # Extract parameters
-            for param in details.get("parameters", []):
-                param_info = {
-                    "name": param.get("name"),
-                    "in": param.get("in"),
-                    "required": param.get("required", False),
-                    "type": param.get("schema", {}).get("type"),
-                    "description": param.get("description", "")
-                }
-                endpoint_info["parameters"].append(param_info)
-            
-            # Extract request body info
-            if "requestBody" in details:
-                request_body = details["requestBody"]
-                endpoint_info["request_body"] = {
-                    "required": request_body.get("required", False),
-                    "content_types": list(request_body.get("content", {}).keys()),
-                    "schema": request_body.get("content", {}).get("application/json", {}).get("schema", {}),
-                    "examples": request_body.get("content", {}).get("application/json", {}).get("examples", {})
-                }
-            
-            endpoint_key = f"{method.upper()} {path}"
-            discovery_info["endpoints"][endpoint_key] = endpoint_info
-            
-            # Categorize endpoints
-            tags = details.get("tags", [])
-            for tag in tags:
-                tag_lower = tag.lower()
-                if "deployment" in tag_lower:
-                    discovery_info["categories"]["deployments"].append(endpoint_key)
-                elif "team" in tag_lower:
-                    discovery_info["categories"]["teams"].append(endpoint_key)
-                elif "service" in tag_lower:
-                    discovery_info["categories"]["services"].append(endpoint_key)
-                elif "incident" in tag_lower:
-                    discovery_info["categories"]["incidents"].append(endpoint_key)
-                elif "measurement" in tag_lower or "metric" in tag_lower:
-                    discovery_info["categories"]["measurements"].append(endpoint_key)
-                elif "health" in tag_lower:
-                    discovery_info["categories"]["health"].append(endpoint_key)
-    
+    _discovery_cache["discover_api"] = discovery_info
     return discovery_info
 
 
@@ -469,80 +919,113 @@ async def get_endpoint_details(endpoint_path: str, method: str = "GET") -> Dict[
     """
     if not OPENAPI_SPEC:
         return {"error": "OpenAPI specification not available"}
-    
-    method = method.upper()
+
+    if _CACHE_DISABLED:
+        return _endpoint_details_impl.__wrapped__(endpoint_path, method.upper())
+    return _endpoint_details_impl(endpoint_path, method.upper())
+
+
+@functools.lru_cache(maxsize=512)
+def _endpoint_details_impl(endpoint_path: str, method: str) -> Dict[str, Any]:
+    """Cached lookup backing get_endpoint_details; spec is static at runtime."""
+    # Serve from the detail index precomputed at spec load time
+    endpoint_info = ENDPOINT_DETAIL_INDEX.get((endpoint_path, method))
+    if endpoint_info is not None:
+        return endpoint_info
+
     paths = OPENAPI_SPEC.get("paths", {})
-    
+
     if endpoint_path not in paths:
-        available_paths = list(paths.keys())
+        # Suggest near misses instead of dumping the whole path list
+        import difflib
+        suggestions = difflib.get_close_matches(endpoint_path, paths.keys(), n=10, cutoff=0.4)
         return {
             "error": f"Endpoint '{endpoint_path}' not found",
-            "available_endpoints": available_paths
-        }
-    
-    endpoint_methods = paths[endpoint_path]
-    if method.lower() not in endpoint_methods:
-        available_methods = list(endpoint_methods.keys())
-        return {
-            "error": f"Method '{method}' not available for '{endpoint_path}'",
-            "available_methods": [m.upper() for m in available_methods]
+            "suggestions": suggestions,
+            "total_available": len(paths)
         }
-    
-    details = endpoint_methods[method.lower()]
-    
-    endpoint_info = {
-        "endpoint": f"{method} {endpoint_path}",
-        "summary": details.get("summary", ""),
-        "description": details.get("description", ""),
-        "tags": details.get("tags", []),
-        "parameters": {
-            "query": [],
-            "path": [],
-            "header": []
-        },
-        "request_body": None,
-        "responses": {},
-        "examples": {},
-        "mcp_tool_name": _get_mcp_tool_name(endpoint_path, method)
+
+    available_methods = list(paths[endpoint_path].keys())
+    return {
+        "error": f"Method '{method}' not available for '{endpoint_path}'",
+        "available_methods": [m.upper() for m in available_methods]
     }
-    
-    # Process parameters
-    for param in details.get("parameters", []):
-        param_info = {
-            "name": param.get("name"),
-            "type": param.get("schema", {}).get("type", "string"),
-            "required": param.get("required", False),
-            "description": param.get("description", ""),
-            "default": param.get("schema", {}).get("default"),
-            "enum": param.get("schema", {}).get("enum"),
-            "minimum": param.get("schema", {}).get("minimum"),
-            "maximum": param.get("schema", {}).get("maximum")
-        }
-        
-        param_location = param.get("in", "query")
-        endpoint_info["parameters"][param_location].append(param_info)
-    
-    # Process request body
-    if "requestBody" in details:
-        request_body = details["requestBody"]
-        content = request_body.get("content", {})
-        json_content = content.get("application/json", {})
-        
-        endpoint_info["request_body"] = {
-            "required": request_body.get("required", False),
-            "content_type": "application/json",
-            "schema": json_content.get("schema", {}),
-            "examples": json_content.get("examples", {})
-        }
-    
-    # Process responses
-    for status_code, response in details.get("responses", {}).items():
-        endpoint_info["responses"][status_code] = {
-            "description": response.get("description", ""),
-            "schema": response.get("content", {}).get("application/json", {}).get("schema", {})
-        }
-    
-    return endpoint_info
+
+
+# Static catalog of MCP tools by category; hoisted to module scope and the
+# response precomputed once so the tool does not rebuild the literal per call
+_API_CATEGORIES = {
+    "deployments": {
+        "description": "View deployment information (read-only)",
+        "endpoints": [
+            {"tool": "list_deployments", "method": "GET", "path": "/api/v1/deployments", "description": "List deployments with filtering"}
+        ]
+    },
+    "teams": {
+        "description": "View team information using V2 API (read-only)",
+        "endpoints": [
+            {"tool": "search_teams_v2", "method": "GET", "path": "/api/v2/teams", "description": "Search teams with pagination"}
+        ]
+    },
+    "users": {
+        "description": "View user information (read-only)",
+        "endpoints": [
+            {"tool": "search_users", "method": "GET", "path": "/api/v1/users", "description": "Search users with pagination"}
+        ]
+    },
+    "services": {
+        "description": "Retrieve service information",
+        "endpoints": [
+            {"tool": "get_services", "method": "GET", "path": "/api/v1/services/", "description": "Get all services"},
+            {"tool": "get_service", "method": "GET", "path": "/api/v1/services/{service_id}", "description": "Get specific service by ID"}
+        ]
+    },
+    "incidents": {
+        "description": "View incident information (read-only)",
+        "endpoints": [
+            {"tool": "get_incident", "method": "GET", "path": "/api/v1/incidents/{provider_id}", "description": "Get specific incident"},
+            {"tool": "search_incidents", "method": "POST", "path": "/api/v1/incidents/search", "description": "Search incidents with filtering"}
+        ]
+    },
+    "metrics": {
+        "description": "Query and export metrics data (read-only)",
+        "endpoints": [
+            {"tool": "post_metrics", "method": "POST", "path": "/api/v2/measurements", "description": "Query metrics data"},
+            {"tool": "export_metrics", "method": "POST", "path": "/api/v2/measurements/export", "description": "Export metrics in CSV/JSON"}
+        ]
+    },
+    "health": {
+        "description": "Monitor API health",
+        "endpoints": [
+            {"tool": "health_check", "method": "GET", "path": "/api/v1/health", "description": "Check API health status"}
+        ]
+    },
+    "discovery": {
+        "description": "API discovery and reference tools",
+        "endpoints": [
+            {"tool": "discover_api", "method": "N/A", "path": "N/A", "description": "Get comprehensive API information"},
+            {"tool": "get_endpoint_details", "method": "N/A", "path": "N/A", "description": "Get detailed endpoint information"},
+            {"tool": "get_api_categories", "method": "N/A", "path": "N/A", "description": "Get API endpoints by categories"},
+            {"tool": "get_usage_examples", "method": "N/A", "path": "N/A", "description": "Get usage examples"},
+            {"tool": "get_documentation_files", "method": "N/A", "path": "N/A", "description": "List documentation files"},
+            {"tool": "get_supported_metrics", "method": "N/A", "path": "N/A", "description": "Get all supported metrics"},
+            {"tool": "get_metrics_by_category", "method": "N/A", "path": "N/A", "description": "Get metrics by category"},
+            {"tool": "search_metrics", "method": "N/A", "path": "N/A", "description": "Search metrics by name/description"},
+            {"tool": "get_metric_examples", "method": "N/A", "path": "N/A", "description": "Get metric usage examples"},
+            {"tool": "get_active_teams", "method": "N/A", "path": "N/A", "description": "Get all active teams"},
+            {"tool": "get_teams_by_type", "method": "N/A", "path": "N/A", "description": "Get teams by type (engineering/qa)"},
+            {"tool": "get_comparable_teams", "method": "N/A", "path": "N/A", "description": "Get comparable engineering teams"},
+            {"tool": "search_teams_by_focus", "method": "N/A", "path": "N/A", "description": "Search teams by focus area"}
+        ]
+    }
+}
+
+
+_API_CATEGORIES_RESPONSE = {
+    "total_categories": len(_API_CATEGORIES),
+    "total_endpoints": sum(len(cat["endpoints"]) for cat in _API_CATEGORIES.values()),
+    "categories": _API_CATEGORIES
+}
 
 
 @mcp.tool(name="get_api_categories", description="Get API endpoints organized by categories")
@@ -553,77 +1036,209 @@ async def get_api_categories() -> Dict[str, Any]:
     Returns:
         API endpoints grouped by categories like deployments, teams, services, etc.
     """
-    categories = {
-        "deployments": {
-            "description": "View deployment information (read-only)",
-            "endpoints": [
-                {"tool": "list_deployments", "method": "GET", "path": "/api/v1/deployments", "description": "List deployments with filtering"}
+    return _API_CATEGORIES_RESPONSE
+
+
+# Static usage-example catalog, hoisted so get_usage_examples does not
+# rebuild the literal per call; the tool index makes tool_name lookups O(1)
+_USAGE_EXAMPLES = {
+    "deployments": {
+        "list_deployments": {
+            "description": "List recent deployments with filtering (read-only)",
+            "examples": [
+                {
+                    "title": "List 10 most recent deployments",
+                    "code": "await list_deployments(limit=10, sort_dir='desc')",
+                    "parameters": {"limit": 10, "sort_dir": "desc"}
+                },
+                {
+                    "title": "List deployments for specific repository",
+                    "code": "await list_deployments(repository_id=12345, limit=20)",
+                    "parameters": {"repository_id": 12345, "limit": 20}
+                },
+                {
+                    "title": "List deployments in date range",
+                    "code": "await list_deployments(after='2023-01-01', before='2023-12-31')",
+                    "parameters": {"after": "2023-01-01", "before": "2023-12-31"}
+                }
             ]
-        },
-        "teams": {
-            "description": "View team information using V2 API (read-only)",
-            "endpoints": [
-                {"tool": "search_teams_v2", "method": "GET", "path": "/api/v2/teams", "description": "Search teams with pagination"}
+        }
+    },
+    "teams": {
+        "search_teams_v2": {
+            "description": "Search teams with V2 API (read-only)",
+            "examples": [
+                {
+                    "title": "Search all teams",
+                    "code": "await search_teams_v2(page_size=50)",
+                    "parameters": {"page_size": 50}
+                },
+                {
+                    "title": "Search teams by name",
+                    "code": "await search_teams_v2(search_term='backend', page_size=20)",
+                    "parameters": {"search_term": "backend", "page_size": 20}
+                }
             ]
-        },
-        "users": {
-            "description": "View user information (read-only)",
-            "endpoints": [
-                {"tool": "search_users", "method": "GET", "path": "/api/v1/users", "description": "Search users with pagination"}
+        }
+    },
+    "users": {
+        "search_users": {
+            "description": "Search users with filtering (read-only)",
+            "examples": [
+                {
+                    "title": "Search all users",
+                    "code": "await search_users(page_size=50)",
+                    "parameters": {"page_size": 50}
+                },
+                {
+                    "title": "Search users by name",
+                    "code": "await search_users(search_by_field='name', search_term='john', order_by='name')",
+                    "parameters": {"search_by_field": "name", "search_term": "john", "order_by": "name"}
+                }
+            ]
+        }
+    },
+    "metrics": {
+        "post_metrics": {
+            "description": "Query metrics data",
+            "examples": [
+                {
+                    "title": "Get cycle time metrics",
+                    "code": """await post_metrics(
+group_by='organization',
+roll_up='1w',
+requested_metrics=[{'name': 'branch.computed.cycle_time', 'agg': 'p75'}],
+time_ranges=[{'after': '2023-01-01', 'before': '2023-01-31'}]
+)""",
+                    "parameters": {
+                        "group_by": "organization",
+                        "roll_up": "1w",
+                        "requested_metrics": [{"name": "branch.computed.cycle_time", "agg": "p75"}],
+                        "time_ranges": [{"after": "2023-01-01", "before": "2023-01-31"}]
+                    }
+                }
+            ]
+        }
+    },
+    "incidents": {
+        "search_incidents": {
+            "description": "Search incidents with filtering (read-only)",
+            "examples": [
+                {
+                    "title": "Search recent incidents",
+                    "code": "await search_incidents(limit=20, after='2023-01-01')",
+                    "parameters": {"limit": 20, "after": "2023-01-01"}
+                },
+                {
+                    "title": "Search incidents by status",
+                    "code": "await search_incidents(status='open', limit=10)",
+                    "parameters": {"status": "open", "limit": 10}
+                }
             ]
         },
-        "services": {
-            "description": "Retrieve service information",
-            "endpoints": [
-                {"tool": "get_services", "method": "GET", "path": "/api/v1/services/", "description": "Get all services"},
-                {"tool": "get_service", "method": "GET", "path": "/api/v1/services/{service_id}", "description": "Get specific service by ID"}
+        "get_incident": {
+            "description": "Get specific incident details (read-only)",
+            "examples": [
+                {
+                    "title": "Get incident by provider ID",
+                    "code": "await get_incident(provider_id='INC-001')",
+                    "parameters": {"provider_id": "INC-001"}
+                }
+            ]
+        }
+    },
+    "metrics_discovery": {
+        "get_supported_metrics": {
+            "description": "Get comprehensive metrics reference",
+            "examples": [
+                {
+                    "title": "Get all supported metrics",
+                    "code": "await get_supported_metrics()",
+                    "parameters": {}
+                }
             ]
         },
-        "incidents": {
-            "description": "View incident information (read-only)",
-            "endpoints": [
-                {"tool": "get_incident", "method": "GET", "path": "/api/v1/incidents/{provider_id}", "description": "Get specific incident"},
-                {"tool": "search_incidents", "method": "POST", "path": "/api/v1/incidents/search", "description": "Search incidents with filtering"}
+        "search_metrics": {
+            "description": "Search for specific metrics",
+            "examples": [
+                {
+                    "title": "Search cycle time metrics",
+                    "code": "await search_metrics('cycle', category='cycle_time')",
+                    "parameters": {"search_term": "cycle", "category": "cycle_time"}
+                },
+                {
+                    "title": "Find metrics with aggregation support",
+                    "code": "await search_metrics('time', has_aggregation=True)",
+                    "parameters": {"search_term": "time", "has_aggregation": True}
+                }
             ]
         },
-        "metrics": {
-            "description": "Query and export metrics data (read-only)",
-            "endpoints": [
-                {"tool": "post_metrics", "method": "POST", "path": "/api/v2/measurements", "description": "Query metrics data"},
-                {"tool": "export_metrics", "method": "POST", "path": "/api/v2/measurements/export", "description": "Export metrics in CSV/JSON"}
+        "get_metrics_by_category": {
+            "description": "Get metrics organized by category",
+            "examples": [
+                {
+                    "title": "Get all pull request metrics",
+                    "code": "await get_metrics_by_category('pull_requests')",
+                    "parameters": {"category": "pull_requests"}
+                },
+                {
+                    "title": "Get all categories overview",
+                    "code": "await get_metrics_by_category()",
+                    "parameters": {}
+                }
+            ]
+        }
+    },
+    "teams_discovery": {
+        "get_active_teams": {
+            "description": "Get comprehensive active teams reference",
+            "examples": [
+                {
+                    "title": "Get all active teams",
+                    "code": "await get_active_teams()",
+                    "parameters": {}
+                }
             ]
         },
-        "health": {
-            "description": "Monitor API health",
-            "endpoints": [
-                {"tool": "health_check", "method": "GET", "path": "/api/v1/health", "description": "Check API health status"}
+        "get_comparable_teams": {
+            "description": "Get teams suitable for comparison",
+            "examples": [
+                {
+                    "title": "Get engineering teams for comparison",
+                    "code": "await get_comparable_teams()",
+                    "parameters": {}
+                }
             ]
         },
-        "discovery": {
-            "description": "API discovery and reference tools",
-            "endpoints": [
-                {"tool": "discover_api", "method": "N/A", "path": "N/A", "description": "Get comprehensive API information"},
-                {"tool": "get_endpoint_details", "method": "N/A", "path": "N/A", "description": "Get detailed endpoint information"},
-                {"tool": "get_api_categories", "method": "N/A", "path": "N/A", "description": "Get API endpoints by categories"},
-                {"tool": "get_usage_examples", "method": "N/A", "path": "N/A", "description": "Get usage examples"},
-                {"tool": "get_documentation_files", "method": "N/A", "path": "N/A", "description": "List documentation files"},
-                {"tool": "get_supported_metrics", "method": "N/A", "path": "N/A", "description": "Get all supported metrics"},
-                {"tool": "get_metrics_by_category", "method": "N/A", "path": "N/A", "description": "Get metrics by category"},
-                {"tool": "search_metrics", "method": "N/A", "path": "N/A", "description": "Search metrics by name/description"},
-                {"tool": "get_metric_examples", "method": "N/A", "path": "N/A", "description": "Get metric usage examples"},
-                {"tool": "get_active_teams", "method": "N/A", "path": "N/A", "description": "Get all active teams"},
-                {"tool": "get_teams_by_type", "method": "N/A", "path": "N/A", "description": "Get teams by type (engineering/qa)"},
-                {"tool": "get_comparable_teams", "method": "N/A", "path": "N/A", "description": "Get comparable engineering teams"},
-                {"tool": "search_teams_by_focus", "method": "N/A", "path": "N/A", "description": "Search teams by focus area"}
+        "search_teams_by_focus": {
+            "description": "Search teams by focus area",
+            "examples": [
+                {
+                    "title": "Find integration teams",
+                    "code": "await search_teams_by_focus('integration', comparable_only=True)",
+                    "parameters": {"search_term": "integration", "comparable_only": True}
+                },
+                {
+                    "title": "Find QA teams",
+                    "code": "await search_teams_by_focus('automation', team_type='qa')",
+                    "parameters": {"search_term": "automation", "team_type": "qa"}
+                }
             ]
         }
     }
-    
-    return {
-        "total_categories": len(categories),
-        "total_endpoints": sum(len(cat["endpoints"]) for cat in categories.values()),
-        "categories": categories
-    }
+}
+
+
+_TOOL_CATEGORY_INDEX = {
+    tool: cat
+    for cat, tools in _USAGE_EXAMPLES.items()
+    for tool in tools
+}
+
+_USAGE_EXAMPLES_RESPONSE = {
+    "all_categories": list(_USAGE_EXAMPLES.keys()),
+    "examples": _USAGE_EXAMPLES
+}
 
 
 @mcp.tool(name="get_usage_examples", description="Get usage examples for API endpoints")
@@ -638,242 +1253,70 @@ async def get_usage_examples(category: Optional[str] = None, tool_name: Optional
     Returns:
         Usage examples with code snippets and explanations.
     """
-    examples = {
-        "deployments": {
-            "list_deployments": {
-                "description": "List recent deployments with filtering (read-only)",
-                "examples": [
-                    {
-                        "title": "List 10 most recent deployments",
-                        "code": "await list_deployments(limit=10, sort_dir='desc')",
-                        "parameters": {"limit": 10, "sort_dir": "desc"}
-                    },
-                    {
-                        "title": "List deployments for specific repository",
-                        "code": "await list_deployments(repository_id=12345, limit=20)",
-                        "parameters": {"repository_id": 12345, "limit": 20}
-                    },
-                    {
-                        "title": "List deployments in date range",
-                        "code": "await list_deployments(after='2023-01-01', before='2023-12-31')",
-                        "parameters": {"after": "2023-01-01", "before": "2023-12-31"}
-                    }
-                ]
-            }
-        },
-        "teams": {
-            "search_teams_v2": {
-                "description": "Search teams with V2 API (read-only)",
-                "examples": [
-                    {
-                        "title": "Search all teams",
-                        "code": "await search_teams_v2(page_size=50)",
-                        "parameters": {"page_size": 50}
-                    },
-                    {
-                        "title": "Search teams by name",
-                        "code": "await search_teams_v2(search_term='backend', page_size=20)",
-                        "parameters": {"search_term": "backend", "page_size": 20}
-                    }
-                ]
-            }
-        },
-        "users": {
-            "search_users": {
-                "description": "Search users with filtering (read-only)",
-                "examples": [
-                    {
-                        "title": "Search all users",
-                        "code": "await search_users(page_size=50)",
-                        "parameters": {"page_size": 50}
-                    },
-                    {
-                        "title": "Search users by name",
-                        "code": "await search_users(search_by_field='name', search_term='john', order_by='name')",
-                        "parameters": {"search_by_field": "name", "search_term": "john", "order_by": "name"}
-                    }
-                ]
-            }
-        },
-        "metrics": {
-            "post_metrics": {
-                "description": "Query metrics data",
-                "examples": [
-                    {
-                        "title": "Get cycle time metrics",
-                        "code": """await post_metrics(
-    group_by='organization',
-    roll_up='1w',
-    requested_metrics=[{'name': 'branch.computed.cycle_time', 'agg': 'p75'}],
-    time_ranges=[{'after': '2023-01-01', 'before': '2023-01-31'}]
-)""",
-                        "parameters": {
-                            "group_by": "organization",
-                            "roll_up": "1w",
-                            "requested_metrics": [{"name": "branch.computed.cycle_time", "agg": "p75"}],
-                            "time_ranges": [{"after": "2023-01-01", "before": "2023-01-31"}]
-                        }
-                    }
-                ]
-            }
-        },
-        "incidents": {
-            "search_incidents": {
-                "description": "Search incidents with filtering (read-only)",
-                "examples": [
-                    {
-                        "title": "Search recent incidents",
-                        "code": "await search_incidents(limit=20, after='2023-01-01')",
-                        "parameters": {"limit": 20, "after": "2023-01-01"}
-                    },
-                    {
-                        "title": "Search incidents by status",
-                        "code": "await search_incidents(status='open', limit=10)",
-                        "parameters": {"status": "open", "limit": 10}
-                    }
-                ]
-            },
-            "get_incident": {
-                "description": "Get specific incident details (read-only)",
-                "examples": [
-                    {
-                        "title": "Get incident by provider ID",
-                        "code": "await get_incident(provider_id='INC-001')",
-                        "parameters": {"provider_id": "INC-001"}
-                    }
-                ]
-            }
-        },
-        "metrics_discovery": {
-            "get_supported_metrics": {
-                "description": "Get comprehensive metrics reference",
-                "examples": [
-                    {
-                        "title": "Get all supported metrics",
-                        "code": "await get_supported_metrics()",
-                        "parameters": {}
-                    }
-                ]
-            },
-            "search_metrics": {
-                "description": "Search for specific metrics",
-                "examples": [
-                    {
-                        "title": "Search cycle time metrics",
-                        "code": "await search_metrics('cycle', category='cycle_time')",
-                        "parameters": {"search_term": "cycle", "category": "cycle_time"}
-                    },
-                    {
-                        "title": "Find metrics with aggregation support",
-                        "code": "await search_metrics('time', has_aggregation=True)",
-                        "parameters": {"search_term": "time", "has_aggregation": True}
-                    }
-                ]
-            },
-            "get_metrics_by_category": {
-                "description": "Get metrics organized by category",
-                "examples": [
-                    {
-                        "title": "Get all pull request metrics",
-                        "code": "await get_metrics_by_category('pull_requests')",
-                        "parameters": {"category": "pull_requests"}
-                    },
-                    {
-                        "title": "Get all categories overview",
-                        "code": "await get_metrics_by_category()",
-                        "parameters": {}
-                    }
-                ]
-            }
-        },
-        "teams_discovery": {
-            "get_active_teams": {
-                "description": "Get comprehensive active teams reference",
-                "examples": [
-                    {
-                        "title": "Get all active teams",
-                        "code": "await get_active_teams()",
-                        "parameters": {}
-                    }
-                ]
-            },
-            "get_comparable_teams": {
-                "description": "Get teams suitable for comparison",
-                "examples": [
-                    {
-                        "title": "Get engineering teams for comparison",
-                        "code": "await get_comparable_teams()",
-                        "parameters": {}
-                    }
-                ]
-            },
-            "search_teams_by_focus": {
-                "description": "Search teams by focus area",
-                "examples": [
-                    {
-                        "title": "Find integration teams",
-                        "code": "await search_teams_by_focus('integration', comparable_only=True)",
-                        "parameters": {"search_term": "integration", "comparable_only": True}
-                    },
-                    {
-                        "title": "Find QA teams",
-                        "code": "await search_teams_by_focus('automation', team_type='qa')",
-                        "parameters": {"search_term": "automation", "team_type": "qa"}
-                    }
-                ]
-            }
-        }
-    }
-    
     if tool_name:
-        # Find specific tool examples
-        for cat_name, cat_examples in examples.items():
-            if tool_name in cat_examples:
-                return {
-                    "tool": tool_name,
-                    "category": cat_name,
-                    "examples": cat_examples[tool_name]
-                }
+        # O(1) lookup via the precomputed tool -> category index
+        cat_name = _TOOL_CATEGORY_INDEX.get(tool_name)
+        if cat_name is not None:
+            return {
+                "tool": tool_name,
+                "category": cat_name,
+                "examples": _USAGE_EXAMPLES[cat_name][tool_name]
+            }
         return {"error": f"No examples found for tool '{tool_name}'"}
-    
+
     if category:
-        if category in examples:
+        if category in _USAGE_EXAMPLES:
             return {
                 "category": category,
-                "tools": examples[category]
+                "tools": _USAGE_EXAMPLES[category]
             }
-        return {"error": f"Category '{category}' not found", "available_categories": list(examples.keys())}
-    
-    return {
-        "all_categories": list(examples.keys()),
-        "examples": examples
-    }
+        return {"error": f"Category '{category}' not found", "available_categories": list(_USAGE_EXAMPLES.keys())}
+
+    return _USAGE_EXAMPLES_RESPONSE
+
+
+# Cached docs listing, invalidated when the directory mtime changes
+_docs_cache: Optional[tuple] = None
 
 
 @mcp.tool(name="get_documentation_files", description="List available documentation files")
 async def get_documentation_files() -> Dict[str, Any]:
     """
     Get list of available documentation files.
-    
+
     Returns:
         List of documentation files with descriptions.
     """
+    global _docs_cache
+
     if not DOCS_PATH.exists():
         return {"error": "Documentation directory not found"}
-    
+
+    mtime = DOCS_PATH.stat().st_mtime
+    if _docs_cache is not None and _docs_cache[0] == mtime:
+        return _docs_cache[1]
+
+    # os.scandir reads the directory in one syscall per batch and avoids the
+    # per-entry stat calls hidden inside Path.glob
     doc_files = []
-    for file_path in DOCS_PATH.glob("*.pdf"):
-        doc_files.append({
-            "filename": file_path.name,
-            "category": file_path.stem.split(" - ")[0] if " - " in file_path.stem else file_path.stem,
-            "path": str(file_path.relative_to(Path(__file__).parent))
-        })
-    
-    return {
+    with os.scandir(DOCS_PATH) as entries:
+        for entry in entries:
+            if not (entry.is_file() and entry.name.endswith(".pdf")):
+                continue
+            stem = entry.name[:-len(".pdf")]
+            doc_files.append({
+                "filename": entry.name,
+                "category": stem.split(" - ")[0] if " - " in stem else stem,
+                "path": os.path.relpath(entry.path, Path(__file__).parent)
+            })
+
+    result = {
         "documentation_path": str(DOCS_PATH),
         "total_files": len(doc_files),
-        "files": sorted(doc_files, key=lambda x: x["category"])
+        "files": sorted(doc_files, key=itemgetter("category"))
     }
+    _docs_cache = (mtime, result)
+    return result
 
 
 @mcp.tool(name="get_supported_metrics", description="Get comprehensive list of supported LinearB metrics")
@@ -887,7 +1330,7 @@ async def get_supported_metrics() -> Dict[str, Any]:
     return {
         "total_metrics": len(SUPPORTED_METRICS),
         "categories": len(METRICS_CATEGORIES),
-        "metrics": SUPPORTED_METRICS,
+        "metrics": dict(_METRIC_DICTS),
         "categories_info": METRICS_CATEGORIES,
         "usage_note": "Use these metric names in post_metrics() calls. Specify aggregation (p75, p50, avg) where supported."
     }
@@ -904,6 +1347,18 @@ async def get_metrics_by_category(category: Optional[str] = None) -> Dict[str, A
     Returns:
         Metrics organized by category or specific category details.
     """
+    if _CACHE_DISABLED:
+        return _metrics_by_category_impl.__wrapped__(category)
+    return _metrics_by_category_impl(category)
+
+
+@functools.lru_cache(maxsize=128)
+def _metrics_by_category_impl(category: Optional[str]) -> Dict[str, Any]:
+    """Cached lookup backing get_metrics_by_category; reference data is static.
+
+    The cache is bounded because the key is caller-supplied: an unbounded
+    cache would grow one error entry per unique invalid category string.
+    """
     if category:
         if category not in METRICS_CATEGORIES:
             return {
@@ -912,7 +1367,7 @@ async def get_metrics_by_category(category: Optional[str] = None) -> Dict[str, A
             }
         
         cat_info = METRICS_CATEGORIES[category]
-        metrics_details = {name: SUPPORTED_METRICS[name] for name in cat_info["metrics"]}
+        metrics_details = {name: _METRIC_DICTS[name] for name in cat_info["metrics"]}
         
         return {
             "category": category,
@@ -956,31 +1411,29 @@ async def search_metrics(
     Returns:
         Matching metrics with details.
     """
-    if not search_term or len(search_term.strip()) < 2:
+    match = _FOCUS_TERM_RE.match(search_term) if search_term else None
+    if not match:
         raise ValueError("search_term must be at least 2 characters long")
-    
-    search_term = search_term.lower().strip()
+
+    search_term = match.group(1).lower()
     matching_metrics = {}
-    
+
     for metric_name, metric_data in SUPPORTED_METRICS.items():
-        # Check if search term matches name or description
-        name_match = search_term in metric_name.lower()
-        desc_match = search_term in metric_data["description"].lower()
-        
-        if not (name_match or desc_match):
-            continue
-        
-        # Apply category filter
-        if category and metric_data["category"] != category:
+        # Cheap equality/membership filters first; the substring scan only
+        # runs for metrics that survive them
+        if category and metric_data.category != category:
             continue
-        
-        # Apply aggregation filter
+
         if has_aggregation is not None:
-            has_agg = len(metric_data["aggregations"]) > 0
-            if has_aggregation != has_agg:
+            if has_aggregation != (metric_name in METRICS_WITH_AGGREGATION):
                 continue
-        
-        matching_metrics[metric_name] = metric_data
+
+        # Check if search term matches name or description (pre-lowered)
+        name_lower, desc_lower = _METRIC_SEARCH_TEXT[metric_name]
+        if search_term not in name_lower and search_term not in desc_lower:
+            continue
+
+        matching_metrics[metric_name] = _METRIC_DICTS[metric_name]
     
     return {
         "search_term": search_term,
@@ -1001,7 +1454,10 @@ async def get_metric_examples() -> Dict[str, Any]:
     Returns:
         Example metric queries with different aggregations and combinations.
     """
-    return {
+    if not _CACHE_DISABLED and "get_metric_examples" in _discovery_cache:
+        return _discovery_cache["get_metric_examples"]
+
+    examples = {
         "examples": {
             "cycle_time_analysis": {
                 "description": "Analyze development cycle time with different aggregations",
@@ -1089,24 +1545,19 @@ async def get_metric_examples() -> Dict[str, Any]:
             "Use appropriate roll_up periods: 1d for detailed analysis, 1w for trends, 1mo for high-level overview"
         ]
     }
+    _discovery_cache["get_metric_examples"] = examples
+    return examples
 
 
-@mcp.tool(name="get_active_teams", description="Get list of active teams for analysis")
 @mcp.tool(name="get_active_teams", description="Get list of active teams for analysis")
 async def get_active_teams() -> Dict[str, Any]:
     """
     Get comprehensive information about all active teams.
-    
+
     Returns:
         Complete active teams reference including types, comparability, and focus areas.
     """
-    return {
-        "total_teams": len(ACTIVE_TEAMS),
-        "team_types": len(TEAM_TYPES),
-        "teams": ACTIVE_TEAMS,
-        "types": TEAM_TYPES,
-        "usage_note": "Use team names in metrics queries. Engineering teams are comparable, QA teams should be analyzed separately."
-    }
+    return _ACTIVE_TEAMS_RESPONSE
 
 
 @mcp.tool(name="get_teams_by_type", description="Get teams filtered by type")
@@ -1121,40 +1572,16 @@ async def get_teams_by_type(team_type: Optional[str] = None) -> Dict[str, Any]:
    fily type or overview of all types.
     """
     if team_type:
-        if team_type not in TEAM_TYPES:
+        response = _TEAMS_BY_TYPE_RESPONSES.get(team_type)
+        if response is None:
             return {
                 "error": f"Team type '{team_type}' not found",
                 "available_types": list(TEAM_TYPES.keys())
             }
-        
-        type_info = TEAM_TYPES[team_type]
-        teams_details = {team_id: ACTIVE_TEAMS[team_id] for team_id in type_info["teams"]}
-        
-        return {
-            "team_type": team_type,
-            "name": type_info["name"],
-            "description": type_info["description"],
-            "comparable": type_info["comparable"],
-            "total_teams": len(type_info["teams"]),
-            "teams": teams_details
-        }
-    
+        return response
+
     # Return all types with summary
-    result = {
-        "total_types": len(TEAM_TYPES),
-        "types": {}
-    }
-    
-    for type_key, type_info in TEAM_TYPES.items():
-        result["types"][type_key] = {
-            "name": type_info["name"],
-            "description": type_info["description"],
-            "comparable": type_info["comparable"],
-            "team_count": len(type_info["teams"]),
-            "teams": type_info["teams"]
-        }
-    
-    return result
+    return _TEAM_TYPES_OVERVIEW
 
 
 @mcp.tool(name="get_comparable_teams", description="Get teams that can be compared for analysis")
@@ -1165,22 +1592,7 @@ async def get_comparable_teams() -> Dict[str, Any]:
     Returns:
         Engineering teams that can be compared in metrics analysis.
     """
-    comparable_teams = {
-        team_id: team_data 
-        for team_id, team_data in ACTIVE_TEAMS.items() 
-        if team_data["comparable"]
-    }
-    
-    return {
-        "total_comparable_teams": len(comparable_teams),
-        "teams": comparable_teams,
-        "excluded_teams": {
-            team_id: team_data 
-            for team_id, team_data in ACTIVE_TEAMS.items() 
-            if not team_data["comparable"]
-        },
-        "usage_note": "These teams can be compared in metrics analysis. QA teams are tracked separately."
-    }
+    return _COMPARABLE_TEAMS_RESPONSE
 
 
 @mcp.tool(name="search_teams_by_focus", description="Search teams by focus area or name")
@@ -1200,31 +1612,39 @@ async def search_teams_by_focus(
     Returns:
         Matching teams with details.
     """
-    if not search_term or len(search_term.strip()) < 2:
+    match = _FOCUS_TERM_RE.match(search_term) if search_term else None
+    if not match:
         raise ValueError("search_term must be at least 2 characters long")
-    
-    search_term = search_term.lower().strip()
+
+    if _CACHE_DISABLED:
+        return _team_search_impl.__wrapped__(match.group(1).lower(), team_type, comparable_only)
+    return _team_search_impl(match.group(1).lower(), team_type, comparable_only)
+
+
+@functools.lru_cache(maxsize=128)
+def _team_search_impl(search_term: str, team_type: Optional[str], comparable_only: bool) -> Dict[str, Any]:
+    """Cached search backing search_teams_by_focus; team data is static.
+
+    Clients tend to repeat a small vocabulary of focus queries, so the full
+    result dict is memoized per normalized (term, filters) triple.
+    """
     matching_teams = {}
-    
-    for team_id, team_data in ACTIVE_TEAMS.items():
-        # Check if search term matches name, description, or focus areas
-        name_match = search_term in team_data["name"].lower()
-        desc_match = search_term in team_data["description"].lower()
-        focus_match = any(search_term in area.lower() for area in team_data["focus_areas"])
-        
-        if not (name_match or desc_match or focus_match):
-            continue
-        
-        # Apply team type filter
-        if team_type and team_data["type"] != team_type:
-            continue
-        
-        # Apply comparable filter
-        if comparable_only and not team_data["comparable"]:
+
+    # Push the cheap filters into the iteration source: start from the
+    # narrowest static partition
+    source_ids = _TEAM_IDS_BY_TYPE.get(team_type, frozenset()) if team_type else _ALL_TEAM_IDS
+    if comparable_only:
+        source_ids = source_ids & _COMPARABLE_TEAM_IDS
+
+    for team_id in sorted(source_ids):
+        # One linear scan over the fused lowercase blob covers name,
+        # description, and focus areas; the separator byte keeps a match
+        # from spanning two fields
+        if search_term not in _TEAM_SEARCH_BLOB[team_id]:
             continue
-        
-        matching_teams[team_id] = team_data
-    
+
+        matching_teams[team_id] = _TEAM_DICTS[team_id]
+
     return {
         "search_term": search_term,
         "filters": {
@@ -1235,56 +1655,147 @@ async def search_teams_by_focus(
         "teams": matching_teams
     }
 
-def _get_mcp_tool_name(endpoint_path: str, method: str) -> Optional[str]:
-    """Helper function to map API endpoints to MCP tool names."""
-    endpoint_map = {
-        # Read-only endpoints (GET operations)
-        ("GET", "/api/v1/deployments"): "list_deployments",
-        ("GET", "/api/v2/teams"): "search_teams_v2",
-        ("GET", "/api/v1/users"): "search_users",
-        ("GET", "/api/v1/services/"): "get_services",
-        ("GET", "/api/v1/services/{service_id}"): "get_service",
-        ("GET", "/api/v1/incidents/{provider_id}"): "get_incident",
-        ("GET", "/api/v1/health"): "health_check",
-        
-        # Read-only POST operations (search/query operations)
-        ("POST", "/api/v1/incidents/search"): "search_incidents",
-        ("POST", "/api/v2/measurements"): "post_metrics",
-        ("POST", "/api/v2/measurements/export"): "export_metrics",
-        
-        # Write operations are commented out for read-only server
-        # ("POST", "/api/v1/deployments"): "create_deployment",
-        # ("POST", "/api/v2/teams"): "create_teams_v2",
-        # ("DELETE", "/api/v2/teams/{team_id}"): "delete_team_v2",
-        # ("PATCH", "/api/v2/teams/{team_id}"): "update_team_v2",
-        # ("POST", "/api/v2/teams/{team_id}/members"): "add_team_members_v2",
-        # ("DELETE", "/api/v2/teams/{team_id}/members/{user_id_or_email}"): "remove_team_member_v2",
-        # ("POST", "/api/v1/users"): "create_users",
-        # ("DELETE", "/api/v1/users/{user_id}"): "delete_user",
-        # ("PATCH", "/api/v1/users/{user_id}"): "update_user",
-        # ("POST", "/api/v1/incidents"): "create_incident",
-        # ("POST", "/api/v1/incidents/{provider_id}"): "update_incident",
-        # ("DELETE", "/api/v1/incidents/{provider_id}"): "delete_incident",
-        # ("POST", "/api/v1/report/metric"): "post_custom_metric",
-        # ("POST", "/api/v1/cycle-time-stages"): "create_cycle_time_stage",
-    }
-    
-    return endpoint_map.get((method.upper(), endpoint_path))
-
-
 # =============================================================================
 # API REQUEST HELPER
 # =============================================================================
 
+# Idempotent GET endpoints whose responses change slowly get a short TTL
+# cache; everything else always hits the network. Entries are keyed on
+# (endpoint, sorted params) and refreshed under a per-key lock so concurrent
+# misses collapse into a single upstream request.
+_GET_CACHE_TTLS = (
+    ("/api/v1/health", 5.0),
+    ("/api/v1/services", 60.0),
+    ("/api/v1/deployments", 10.0),
+)
+_GET_CACHE: Dict[tuple, tuple] = {}
+_GET_CACHE_LOCKS: Dict[tuple, asyncio.Lock] = {}
+
+# Keys are caller-supplied param sets (pagination offsets, date ranges), so
+# the cache must be bounded or a client sweeping parameters grows it - and
+# its lock dict - without limit for the life of the server
+_GET_CACHE_MAX = 256
+
+
+def _get_cache_ttl(endpoint: str) -> Optional[float]:
+    """Return the cache TTL for a GET endpoint, or None if uncacheable."""
+    return next((ttl for prefix, ttl in _GET_CACHE_TTLS if endpoint.startswith(prefix)), None)
+
+
+def _prune_get_cache() -> None:
+    """Drop expired GET cache entries and their locks; evict oldest over cap.
+
+    Evicting a lock another task still holds is harmless: the next miss for
+    that key just creates a fresh lock, worst case one duplicate request.
+    """
+    now = time.monotonic()
+    for key in [k for k, (ts, _) in _GET_CACHE.items() if now - ts >= _get_cache_ttl(k[0])]:
+        _GET_CACHE.pop(key, None)
+        _GET_CACHE_LOCKS.pop(key, None)
+    while len(_GET_CACHE) >= _GET_CACHE_MAX:
+        oldest = min(_GET_CACHE, key=lambda k: _GET_CACHE[k][0])
+        _GET_CACHE.pop(oldest, None)
+        _GET_CACHE_LOCKS.pop(oldest, None)
+
+
+# Identical requests already in flight share one upstream call; every tool
+# here is read-only, so duplicate suppression cannot lose writes
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+# Strong references to the background request tasks so the event loop
+# cannot garbage-collect them mid-flight
+_inflight_tasks: set = set()
+
+
+async def _resolve_inflight(key: tuple, future: asyncio.Future,
+                            method: str, endpoint: str,
+                            params: Optional[Dict], json_data: Optional[Dict]) -> None:
+    """Perform the shared request and resolve the single-flight future."""
+    try:
+        result = await _perform_request(method, endpoint, params, json_data)
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark retrieved so a batch whose waiters were all cancelled does
+        # not log an unconsumed-exception warning
+        future.exception()
+    else:
+        future.set_result(result)
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+async def _request_once(method: str, endpoint: str, params: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict[str, Any]:
+    """Single-flight wrapper around _perform_request.
+
+    The request runs in a background task that outlives its callers, and
+    every caller awaits the shared future through asyncio.shield: if one
+    caller is cancelled (wait_for timeout, client disconnect), only that
+    caller sees CancelledError while the request completes normally for
+    the remaining waiters.
+    """
+    key = (
+        method,
+        endpoint,
+        tuple(sorted(params.items())) if params else None,
+        _json_dumps(json_data) if json_data is not None else None
+    )
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = asyncio.get_running_loop().create_future()
+        _INFLIGHT[key] = future
+        task = asyncio.create_task(
+            _resolve_inflight(key, future, method, endpoint, params, json_data)
+        )
+        _inflight_tasks.add(task)
+        task.add_done_callback(_inflight_tasks.discard)
+    return await asyncio.shield(future)
+
+
 async def _make_request(method: str, endpoint: str, params: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict[str, Any]:
-    """Helper function to make HTTP requests with proper error handling."""
+    """Helper function to make HTTP requests with TTL caching for slow-changing GETs."""
+    method = method.upper()
+    if method != "GET":
+        return await _request_once(method, endpoint, params, json_data)
+
+    ttl = _get_cache_ttl(endpoint)
+    if ttl is None:
+        return await _request_once(method, endpoint, params, json_data)
+
+    key = (endpoint, tuple(sorted(params.items())) if params else ())
+    cached = _GET_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    lock = _GET_CACHE_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another waiter may have refreshed the entry while we queued
+        cached = _GET_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        result = await _request_once(method, endpoint, params, json_data)
+        _prune_get_cache()
+        _GET_CACHE[key] = (time.monotonic(), result)
+        return result
+
+
+async def _perform_request(method: str, endpoint: str, params: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict[str, Any]:
+    """Issue a single HTTP request with proper error handling."""
+    import httpx
+
+    http_client = _get_client()
     try:
-        if method.upper() == "GET":
-            response = await client.get(endpoint, params=params)
-        elif method.upper() == "POST":
-            response = await client.post(endpoint, params=params, json=json_data)
-        elif method.upper() == "DELETE":
-            response = await client.delete(endpoint)
+        if method == "GET":
+            response = await http_client.get(endpoint, params=params)
+        elif method == "POST":
+            if json_data is not None and orjson is not None:
+                # Encode the body with orjson instead of httpx's stdlib-json
+                # path; the client's default Content-Type header already
+                # declares application/json
+                response = await http_client.post(endpoint, params=params, content=orjson.dumps(json_data))
+            else:
+                response = await http_client.post(endpoint, params=params, json=json_data)
+        elif method == "DELETE":
+            response = await http_client.delete(endpoint)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
         
@@ -1293,20 +1804,94 @@ async def _make_request(method: str, endpoint: str, params: Optional[Dict] = Non
         # Handle empty responses for DELETE operations
         if response.status_code == 204 or not response.content:
             return {"status": "success", "message": "Operation completed successfully"}
-        
-        return response.json()
+
+        return _json_loads(response.content)
     
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error {e.response.status_code} for {method} {endpoint}: {e.response.text}")
+        logger.error("HTTP error %s for %s %s: %s", e.response.status_code, method, endpoint, e.response.text)
         raise Exception(f"API request failed with status {e.response.status_code}: {e.response.text}")
     except httpx.RequestError as e:
-        logger.error(f"Request error for {method} {endpoint}: {str(e)}")
+        logger.error("Request error for %s %s: %s", method, endpoint, e)
         raise Exception(f"Network error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error for {method} {endpoint}: {str(e)}")
+        logger.error("Unexpected error for %s %s: %s", method, endpoint, e)
         raise Exception(f"Unexpected error: {str(e)}")
 
 
+class _MetricsBatcher:
+    """
+    Coalesces concurrent post_metrics calls into fewer HTTP requests.
+
+    Calls arriving within the batch window that share the same group_by,
+    roll_up, and id filters are merged into a single /api/v2/measurements
+    request whose requested_metrics and time_ranges are the union of the
+    individual payloads. Every waiter receives the combined response, so
+    callers may see rows for metric/time-range combinations they did not
+    ask for themselves, and every call waits out the window before its
+    request is issued. Because of both costs, coalescing is opt-in:
+    METRICS_BATCH_WINDOW defaults to 0 (disabled) and deployments that
+    fan out many concurrent post_metrics calls can set it to e.g. 0.02.
+    """
+
+    def __init__(self, window: float):
+        self._window = window
+        self._pending: Dict[tuple, List[tuple]] = {}
+        self._flush_tasks: Dict[tuple, asyncio.Task] = {}
+
+    async def submit(self, payload: Dict[str, Any]) -> Any:
+        if self._window <= 0:
+            return await _make_request("POST", "/api/v2/measurements", json_data=payload)
+
+        key = (
+            payload["group_by"],
+            payload["roll_up"],
+            tuple(payload.get("repository_ids") or ()),
+            tuple(payload.get("team_ids") or ())
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append((payload, future))
+        if key not in self._flush_tasks:
+            self._flush_tasks[key] = asyncio.create_task(self._flush_later(key))
+        return await future
+
+    async def _flush_later(self, key: tuple) -> None:
+        await asyncio.sleep(self._window)
+        entries = self._pending.pop(key, [])
+        self._flush_tasks.pop(key, None)
+        if not entries:
+            return
+
+        payload = entries[0][0]
+        if len(entries) > 1:
+            # Union metrics and time ranges across the batch, preserving
+            # first-seen order and dropping duplicates
+            merged_metrics: Dict[tuple, Dict[str, str]] = {}
+            merged_ranges: Dict[tuple, Dict[str, str]] = {}
+            for entry_payload, _ in entries:
+                for metric in entry_payload["requested_metrics"]:
+                    merged_metrics.setdefault((metric.get("name"), metric.get("agg")), metric)
+                for time_range in entry_payload["time_ranges"]:
+                    merged_ranges.setdefault(tuple(sorted(time_range.items())), time_range)
+            payload = dict(payload)
+            payload["requested_metrics"] = list(merged_metrics.values())
+            payload["time_ranges"] = list(merged_ranges.values())
+            logger.info("Coalesced %d post_metrics calls into one request", len(entries))
+
+        try:
+            result = await _make_request("POST", "/api/v2/measurements", json_data=payload)
+        except Exception as exc:
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, future in entries:
+                if not future.done():
+                    future.set_result(result)
+
+
+_metrics_batcher = _MetricsBatcher(window=float(os.getenv("METRICS_BATCH_WINDOW", "0")))
+
+
 @mcp.tool(name="list_deployments", description="List deployments with optional filtering parameters")
 async def list_deployments(
     repository_id: Optional[int] = None,
@@ -1334,19 +1919,27 @@ async def list_deployments(
         commit_sha: Filter by specific commit SHA
     """
     params = {
-        "repository_id": repository_id,
-        "after": after,
-        "before": before,
         "limit": min(limit or 10, 100),  # Enforce API limit
-        "offset": max(offset or 0, 0),   # Ensure non-negative
-        "stage": stage,
-        "sort_by": sort_by,
-        "sort_dir": sort_dir,
-        "commit_sha": commit_sha
+        "offset": max(offset or 0, 0)    # Ensure non-negative
     }
-    # Remove None values
-    params = {k: v for k, v in params.items() if v is not None}
-    
+
+    # Add optional filters directly instead of building a full dict and
+    # stripping the None entries afterwards
+    if repository_id is not None:
+        params["repository_id"] = repository_id
+    if after is not None:
+        params["after"] = after
+    if before is not None:
+        params["before"] = before
+    if stage is not None:
+        params["stage"] = stage
+    if sort_by is not None:
+        params["sort_by"] = sort_by
+    if sort_dir is not None:
+        params["sort_dir"] = sort_dir
+    if commit_sha is not None:
+        params["commit_sha"] = commit_sha
+
     return await _make_request("GET", "/api/v1/deployments", params=params)
 
 
@@ -1372,11 +1965,13 @@ async def search_teams_v2(
         "nonmerged_members_only": nonmerged_members_only
     }
     
-    if search_term and search_term.strip():
-        if len(search_term.strip()) < 1 or len(search_term.strip()) > 100:
+    if search_term:
+        match = _SEARCH_TERM_RE.match(search_term)
+        if match:
+            params["search_term"] = match.group(1)
+        elif search_term.strip():
             raise ValueError("search_term must be between 1 and 100 characters")
-        params["search_term"] = search_term.strip()
-    
+
     return await _make_request("GET", "/api/v2/teams", params=params)
 
 
@@ -1494,25 +2089,30 @@ async def post_metrics(
         time_ranges: List of time ranges (e.g., [{"after": "2023-01-01", "before": "2023-01-31"}])
         repository_ids: Optional list of repository IDs to filter
         team_ids: Optional list of team IDs to filter
+
+    When METRICS_BATCH_WINDOW is set above 0, concurrent calls sharing
+    group_by/roll_up/filters are coalesced into a single API request (see
+    _MetricsBatcher) and the response may include the union of the batched
+    metrics and time ranges; by default every call issues its own request.
     """
     if not requested_metrics:
         raise ValueError("requested_metrics is required and cannot be empty")
     if not time_ranges:
         raise ValueError("time_ranges is required and cannot be empty")
-    
+
     payload = {
         "group_by": group_by,
         "roll_up": roll_up,
         "requested_metrics": requested_metrics,
         "time_ranges": time_ranges
     }
-    
+
     if repository_ids:
         payload["repository_ids"] = repository_ids
     if team_ids:
         payload["team_ids"] = team_ids
-    
-    return await _make_request("POST", "/api/v2/measurements", json_data=payload)
+
+    return await _metrics_batcher.submit(payload)
 
 
 @mcp.tool(name="export_metrics", description="Export metrics data in CSV or JSON format")
@@ -1536,24 +2136,73 @@ async def export_metrics(
         file_format: Export format ('csv' or 'json', default: 'csv')
         repository_ids: Optional list of repository IDs to filter
         team_ids: Optional list of team IDs to filter
+
+    The export is streamed to a temporary file in fixed-size chunks rather
+    than buffered and JSON-parsed in memory; the response carries the file
+    path and size instead of the payload itself.
     """
     if file_format not in ["csv", "json"]:
         raise ValueError("file_format must be 'csv' or 'json'")
-    
+
     payload = {
         "group_by": group_by,
         "roll_up": roll_up,
         "requested_metrics": requested_metrics,
         "time_ranges": time_ranges
     }
-    
+
     if repository_ids:
         payload["repository_ids"] = repository_ids
     if team_ids:
         payload["team_ids"] = team_ids
-    
+
+    import httpx
+
+    http_client = _get_client()
     params = {"file_format": file_format}
-    return await _make_request("POST", "/api/v2/measurements/export", params=params, json_data=payload)
+    path = None
+    try:
+        async with http_client.stream(
+            "POST", "/api/v2/measurements/export",
+            params=params,
+            content=_json_dumps(payload)
+        ) as response:
+            if response.status_code >= 400:
+                # Read the error body while the stream is still open;
+                # once the context exits the response is closed and any
+                # later aread() raises StreamClosed instead
+                detail = (await response.aread()).decode(errors="replace")
+                logger.error("HTTP error %s for POST /api/v2/measurements/export: %s", response.status_code, detail)
+                raise Exception(f"API request failed with status {response.status_code}: {detail}")
+            size = 0
+            fd, path = tempfile.mkstemp(prefix="linearb_export_", suffix=f".{file_format}")
+            with os.fdopen(fd, "wb") as export_file:
+                async for chunk in response.aiter_bytes(65536):
+                    export_file.write(chunk)
+                    size += len(chunk)
+        return {
+            "status": "success",
+            "file_format": file_format,
+            "path": path,
+            "size_bytes": size
+        }
+
+    except httpx.RequestError as e:
+        # A partially written export is useless; don't leave it behind
+        if path is not None:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        logger.error("Request error for POST /api/v2/measurements/export: %s", e)
+        raise Exception(f"Network error: {str(e)}")
+    except Exception:
+        if path is not None:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        raise
 
 
 @mcp.tool(name="search_users", description="Search users with pagination and filtering")
@@ -1595,11 +2244,13 @@ async def search_users(
     if search_by_field and search_by_field in ["name", "email"]:
         params["search_by_field"] = search_by_field
     
-    if search_term and search_term.strip():
-        if len(search_term.strip()) < 1 or len(search_term.strip()) > 100:
+    if search_term:
+        match = _SEARCH_TERM_RE.match(search_term)
+        if match:
+            params["search_term"] = match.group(1)
+        elif search_term.strip():
             raise ValueError("search_term must be between 1 and 100 characters")
-        params["search_term"] = search_term.strip()
-    
+
     if user_role and user_role in ["admin", "editor", "viewer", "external", "basic"]:
         params["user_role"] = user_role
     
@@ -1693,23 +2344,85 @@ async def search_incidents(
 #     """Delete an incident by provider ID."""
 #     endpoint = f"/api/v1/incidents/{provider_id}"
 #     return await _make_request("DELETE", endpoint)
+# Registry of tools callable through bulk_tool_call; read-only by
+# construction since only the exposed read tools are listed
+_BULK_TOOLS = {
+    "discover_api": discover_api,
+    "get_endpoint_details": get_endpoint_details,
+    "get_api_categories": get_api_categories,
+    "get_usage_examples": get_usage_examples,
+    "get_documentation_files": get_documentation_files,
+    "get_supported_metrics": get_supported_metrics,
+    "get_metrics_by_category": get_metrics_by_category,
+    "search_metrics": search_metrics,
+    "get_metric_examples": get_metric_examples,
+    "get_active_teams": get_active_teams,
+    "get_teams_by_type": get_teams_by_type,
+    "get_comparable_teams": get_comparable_teams,
+    "search_teams_by_focus": search_teams_by_focus,
+    "list_deployments": list_deployments,
+    "search_teams_v2": search_teams_v2,
+    "get_services": get_services,
+    "get_service": get_service,
+    "get_incident": get_incident,
+    "health_check": health_check,
+    "post_metrics": post_metrics,
+    "export_metrics": export_metrics,
+    "search_users": search_users,
+    "search_incidents": search_incidents,
+}
+
+
+@mcp.tool(name="bulk_tool_call", description="Run several read-only tools in a single call")
+async def bulk_tool_call(calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Execute a batch of read-only tool calls concurrently in one request.
+
+    Args:
+        calls: List of {"name": tool_name, "args": {...}} entries
+
+    Returns:
+        One entry per call, in order, with "ok" plus either "result" or "error".
+    """
+    if not calls:
+        raise ValueError("calls is required and cannot be empty")
+
+    # Validate every name before constructing any coroutine, so a bad
+    # entry cannot leak already-created, never-awaited coroutines
+    for call in calls:
+        name = call.get("name")
+        if name not in _BULK_TOOLS:
+            raise ValueError(f"Unknown tool '{name}'. Available tools: {sorted(_BULK_TOOLS)}")
+
+    coros = [_BULK_TOOLS[call["name"]](**(call.get("args") or {})) for call in calls]
+    results = await _gather_bounded(*coros)
+    return [
+        {"name": call.get("name"), "ok": False, "error": str(result)}
+        if isinstance(result, BaseException)
+        else {"name": call.get("name"), "ok": True, "result": result}
+        for call, result in zip(calls, results)
+    ]
+
+
+async def warmup():
+    """Populate the lazy discovery caches so the first real call pays nothing."""
+    await asyncio.gather(discover_api(), get_supported_metrics(), get_active_teams())
+
+
 async def cleanup():
     """Cleanup function to close HTTP client."""
-    await client.aclose()
+    if client is not None:
+        await client.aclose()
 
 
 if __name__ == "__main__":
-    import atexit
-    import asyncio
-    
-    # Register cleanup function
-    atexit.register(lambda: asyncio.run(cleanup()))
-    
     try:
         logger.info("Starting LinearB MCP Server...")
         mcp.run()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         raise
+    # The HTTP client is closed by _lifespan on the server's own loop;
+    # nothing is left to tear down here